@@ -11,11 +11,69 @@ Notes:
 from __future__ import annotations
 
 import math
-from typing import Sequence, Optional, List
+from dataclasses import dataclass, field
+from typing import Dict, Sequence, Optional, List, Tuple, Union
 
+import numpy as np
 import mpmath as mp
 
-mp.mp.dps = 50  # default precision; override in caller if needed
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - numba is optional
+    _HAVE_NUMBA = False
+
+# Scans only resolve zeros to ~1e-10, so modest working precision is ample
+# (mpmath op cost grows ~quadratically with dps). Verification paths raise
+# it locally with mp.workdps.
+mp.mp.dps = 20
+
+# log(n) and 1/sqrt(n) tables for the RS main sum, keyed by N.
+# N only grows like sqrt(t/2pi), so nearby t values share the same table.
+_rs_tables: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+
+
+def _rs_table(n_terms: int) -> Tuple[np.ndarray, np.ndarray]:
+    tab = _rs_tables.get(n_terms)
+    if tab is None:
+        n = np.arange(1, n_terms + 1, dtype=np.float64)
+        tab = (np.log(n), 1.0 / np.sqrt(n))
+        _rs_tables[n_terms] = tab
+    return tab
+
+
+if _HAVE_NUMBA:
+    # Fused cos/mul/accumulate kernel: no temporaries, threaded reduction.
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rs_sum(t: float, log_n: np.ndarray, inv_sqrt_n: np.ndarray, theta_t: float) -> float:
+        s = 0.0
+        for i in prange(log_n.shape[0]):
+            s += math.cos(t * log_n[i] - theta_t) * inv_sqrt_n[i]
+        return 2.0 * s
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rs_sum_phased(t: float, log_n: np.ndarray, inv_sqrt_n: np.ndarray, phi: np.ndarray) -> float:
+        s = 0.0
+        for i in prange(log_n.shape[0]):
+            s += math.cos(t * log_n[i] + phi[i]) * inv_sqrt_n[i]
+        return 2.0 * s
+    # Same fused pattern for the Euler-product inner sum over primes:
+    # single pass, no temporaries, vectorized libm cos where available.
+    @njit(fastmath=True, cache=True)
+    def _euler_kernel(t: float, log_p: np.ndarray, coeff: np.ndarray) -> float:
+        acc = 0.0
+        for i in range(log_p.shape[0]):
+            acc += math.cos(t * log_p[i]) * coeff[i]
+        return acc
+else:
+    def _rs_sum(t: float, log_n: np.ndarray, inv_sqrt_n: np.ndarray, theta_t: float) -> float:
+        return 2.0 * float((np.cos(t * log_n - theta_t) * inv_sqrt_n).sum())
+
+    def _rs_sum_phased(t: float, log_n: np.ndarray, inv_sqrt_n: np.ndarray, phi: np.ndarray) -> float:
+        return 2.0 * float((np.cos(t * log_n + phi) * inv_sqrt_n).sum())
+
+    def _euler_kernel(t: float, log_p: np.ndarray, coeff: np.ndarray) -> float:
+        return float((np.cos(t * log_p) * coeff).sum())
 
 
 def theta(t: float) -> mp.mpf:
@@ -27,16 +85,151 @@ def theta(t: float) -> mp.mpf:
     return mp.im(mp.log(mp.gamma(mp.mpf("0.25") + 0.5j * t))) - (t / 2) * mp.log(mp.pi)
 
 
+def theta_asymptotic(t: float) -> float:
+    '''
+    Stirling-based asymptotic expansion of theta(t) in float64:
+        theta(t) ~ (t/2) log(t/2pi) - t/2 - pi/8 + 1/(48t) + 7/(5760 t^3)
+    Agrees with the mpmath theta (mod 2pi; mpmath takes the principal log
+    branch) to ~1e-10 at t=20 and far better beyond — ample for the scan,
+    which only ever uses theta inside cos/exp.
+    '''
+    return (
+        (t / 2) * math.log(t / (2 * math.pi))
+        - t / 2
+        - math.pi / 8
+        + 1.0 / (48 * t)
+        + 7.0 / (5760 * t ** 3)
+    )
+
+
+# Below this the asymptotic expansion is not trusted; fall back to mpmath.
+_THETA_ASYMPTOTIC_T_MIN = 20.0
+
+
+def _theta_fast(t: float) -> float:
+    if t >= _THETA_ASYMPTOTIC_T_MIN:
+        return theta_asymptotic(t)
+    return float(theta(t))
+
+
+def _theta_fast_vec(ts: np.ndarray) -> np.ndarray:
+    out = np.empty_like(ts)
+    hi = ts >= _THETA_ASYMPTOTIC_T_MIN
+    th = ts[hi]
+    out[hi] = (
+        (th / 2) * np.log(th / (2 * math.pi))
+        - th / 2
+        - math.pi / 8
+        + 1.0 / (48 * th)
+        + 7.0 / (5760 * th ** 3)
+    )
+    out[~hi] = [float(theta(t)) for t in ts[~hi]]
+    return out
+
+
 def Z_full(t: float) -> mp.mpf:
     '''
     Ground truth Z(t) computed from mpmath.zeta using:
         Z(t) = zeta(1/2 + i t) * exp(i theta(t))
     '''
     t = mp.mpf(t)
-    return mp.re(mp.zeta(mp.mpf("0.5") + 1j * t) * mp.e ** (1j * theta(t)))
+    return mp.re(mp.zeta(mp.mpf("0.5") + 1j * t) * mp.e ** (1j * _theta_fast(float(t))))
+
+
+def _psi_rs(rho: float) -> float:
+    '''
+    Gabcke's Psi for the first RS remainder term:
+        Psi(p) = cos(2 pi (p^2 - p - 1/16)) / cos(2 pi p)
+    '''
+    return math.cos(2 * math.pi * (rho * rho - rho - 1.0 / 16.0)) / math.cos(2 * math.pi * rho)
+
+
+def _psi3_rs(p: float) -> float:
+    '''
+    Third derivative of _psi_rs (closed form, machine-generated via sympy).
+    '''
+    u = math.pi * (-2 * p ** 2 + 2 * p + 1.0 / 8.0)
+    cu, su = math.cos(u), math.sin(u)
+    cv, sv = math.cos(2 * math.pi * p), math.sin(2 * math.pi * p)
+    sp2 = math.sin(math.pi * p) ** 2
+    return 8 * math.pi ** 2 * (
+        (1 - 2 * p) * (math.pi * (2 * p - 1) ** 2 * su + 3 * cu) * cv ** 3
+        + 3 * math.pi * (2 * p - 1) * (2 * sv ** 2 + cv ** 2) * su * cv
+        - 3 * (math.pi * (2 * p - 1) ** 2 * cu - su) * sv * cv ** 2
+        + math.pi * (-4 * sp2 ** 2 + 4 * sp2 + 5) * sv * cu
+    ) / cv ** 4
 
 
-def Z_riemann_siegel(t: float, n_terms: Optional[int] = None) -> mp.mpf:
+# Taylor coefficients of Psi and its third derivative about the removable
+# singularities rho = 1/4, 3/4 (machine-generated via sympy), used where the
+# closed forms lose precision to the cos(2 pi rho)^k denominators.
+_PSI_SERIES = {
+    0.25: [0.5, -1.0, 2.4674011002723395, -1.6449340668482264, 0.27717591495256194,
+           4.685670608398414, -7.979031066936239, 8.852130154516512, -4.8532567933207345],
+    0.75: [0.5, 1.0, 2.4674011002723395, 1.6449340668482264, 0.27717591495256194,
+           -4.685670608398414, -7.979031066936239, -8.852130154516512, -4.8532567933207345],
+}
+_PSI3_SERIES = {
+    0.25: [-9.869604401089358, 6.652221958861486, 281.1402365039048, -957.4837280323487,
+           1858.9473324484675, -1630.6942825557667, -1269.017718660444, 5930.6968180956355,
+           -10289.021291320061],
+    0.75: [9.869604401089358, 6.652221958861486, -281.1402365039048, -957.4837280323487,
+           -1858.9473324484675, -1630.6942825557667, 1269.017718660444, 5930.6968180956355,
+           10289.021291320061],
+}
+
+
+def _taylor(coeffs: List[float], h: float) -> float:
+    acc = 0.0
+    for c in reversed(coeffs):
+        acc = acc * h + c
+    return acc
+
+
+def _rs_remainder(t: float) -> float:
+    '''
+    First two terms of the RS remainder:
+        R(t) = (-1)^(N+1) a^(-1/2) (C0(rho) + C1(rho)/a),
+    with a = sqrt(t/2pi), N = floor(a), rho = a - N, C0 = Psi and
+    C1 = -(d^3 Psi / d rho^3) / (96 pi^2). Truncation error is O(t^(-5/4))
+    (Gabcke).
+    '''
+    a = math.sqrt(t / (2 * math.pi))
+    N = int(a)
+    rho = a - N
+    for p0 in (0.25, 0.75):
+        if abs(rho - p0) < 0.02:
+            h = rho - p0
+            C0 = _taylor(_PSI_SERIES[p0], h)
+            C1 = -_taylor(_PSI3_SERIES[p0], h) / (96 * math.pi ** 2)
+            break
+    else:
+        C0 = _psi_rs(rho)
+        C1 = -_psi3_rs(rho) / (96 * math.pi ** 2)
+    return ((-1) ** (N + 1) / math.sqrt(a)) * (C0 + C1 / a)
+
+
+# Below this, Gabcke's remainder bound is not worth trusting for a "ground
+# truth" channel; fall back to mpmath.zeta.
+_RS_FULL_T_MIN = 200.0
+
+
+def Z_rs_full(t: float) -> float:
+    '''
+    Z(t) via the Riemann-Siegel formula with the first remainder correction:
+    the float64 main sum plus _rs_remainder. Accurate to ~1e-5 absolute for
+    t >= 200 (checked against mpmath.siegelz), which is ample for locating
+    sign changes; below t = 200 it defers to the mpmath ground truth Z_full.
+    '''
+    t = float(t)
+    if t < _RS_FULL_T_MIN:
+        return float(Z_full(t))
+    n_terms = max(1, int(math.sqrt(t / (2 * math.pi))))
+    log_n, inv_sqrt_n = _rs_table(n_terms)
+    return _rs_sum(t, log_n, inv_sqrt_n, theta_asymptotic(t)) + _rs_remainder(t)
+
+
+def Z_riemann_siegel(t: float, n_terms: Optional[int] = None) -> float:
     '''
     Basic Riemann-Siegel Z(t) approximation:
         Z(t) approx 2 * sum_{n=1}^{N} cos(t log n - theta(t)) / sqrt(n)
@@ -44,7 +237,97 @@ def Z_riemann_siegel(t: float, n_terms: Optional[int] = None) -> mp.mpf:
 
     This is not the full RS formula with remainder terms; it's enough to test whether
     "global mirror symmetry" changes spacing statistics compared to independent prime models.
+
+    The main sum is evaluated in float64 with NumPy (ample for the sign-change scan);
+    only theta(t) stays in mpmath. Use Z_riemann_siegel_mp for high-precision checks.
+    '''
+    t = float(t)
+    if n_terms is None:
+        if t <= 0:
+            return 0.0
+        n_terms = max(1, int(math.sqrt(t / (2 * math.pi))))
+
+    theta_t = _theta_fast(t)
+    log_n, inv_sqrt_n = _rs_table(n_terms)
+    return _rs_sum(t, log_n, inv_sqrt_n, theta_t)
+
+
+def _rs_term_counts(ts: np.ndarray) -> np.ndarray:
+    return np.maximum(1, np.sqrt(np.maximum(ts, 0.0) / (2 * math.pi)).astype(np.int64))
+
+
+def _rs_grid_outer(ts: np.ndarray) -> np.ndarray:
+    out = np.zeros_like(ts)
+    th = _theta_fast_vec(ts)
+    counts = _rs_term_counts(ts)
+    for n_terms in np.unique(counts):
+        m = counts == n_terms
+        log_n, inv_sqrt_n = _rs_table(int(n_terms))
+        out[m] = 2.0 * (np.cos(np.outer(ts[m], log_n) - th[m, None]) @ inv_sqrt_n)
+    out[ts <= 0] = 0.0
+    return out
+
+
+# Re-anchor the rotation state this often so rounding drift stays ~eps.
+_RS_RECURRENCE_RESYNC = 512
+
+
+def _rs_grid_recurrence(ts: np.ndarray) -> np.ndarray:
     '''
+    RS main sum over a uniformly spaced t-grid via the angle-addition
+    recurrence: for each n keep (cos, sin) of t*log(n) and rotate by
+    log(n)*dt per step, so only theta costs a trig call per grid point.
+    cos(t log n - theta) then splits as C*cos(theta) + S*sin(theta).
+    '''
+    th = _theta_fast_vec(ts)
+    counts = _rs_term_counts(ts)
+    n_max = int(counts.max())
+    log_n, inv_sqrt_n = _rs_table(n_max)
+    dt = ts[1] - ts[0]
+    cos_a, sin_a = np.cos(log_n * dt), np.sin(log_n * dt)
+    C, S = np.cos(ts[0] * log_n), np.sin(ts[0] * log_n)
+    out = np.empty_like(ts)
+    for i in range(ts.size):
+        if i:
+            if i % _RS_RECURRENCE_RESYNC == 0:
+                C, S = np.cos(ts[i] * log_n), np.sin(ts[i] * log_n)
+            else:
+                C, S = C * cos_a - S * sin_a, S * cos_a + C * sin_a
+        n = counts[i]
+        out[i] = 2.0 * (
+            (C[:n] @ inv_sqrt_n[:n]) * math.cos(th[i])
+            + (S[:n] @ inv_sqrt_n[:n]) * math.sin(th[i])
+        )
+    out[ts <= 0] = 0.0
+    return out
+
+
+def Z_riemann_siegel_vec(ts: np.ndarray) -> np.ndarray:
+    '''
+    Batch Z_riemann_siegel over a whole t-grid. Uniformly spaced runs go
+    through the incremental-rotation recurrence; leftover points (e.g. the
+    clamped final t_max of scan_grid) use the grouped cos/matvec path.
+    '''
+    ts = np.asarray(ts, dtype=np.float64)
+    if ts.size < 3 or np.any(ts <= 0):
+        return _rs_grid_outer(ts)
+    steps = np.diff(ts)
+    uniform = np.flatnonzero(~np.isclose(steps, steps[0]))
+    split = ts.size if uniform.size == 0 else int(uniform[0]) + 1
+    if split < 3:
+        return _rs_grid_outer(ts)
+    return np.concatenate([_rs_grid_recurrence(ts[:split]), _rs_grid_outer(ts[split:])])
+
+
+def Z_riemann_siegel_mp(t: float, n_terms: Optional[int] = None, dps: int = 50) -> mp.mpf:
+    '''
+    High-precision mpmath version of Z_riemann_siegel, kept for verification.
+    '''
+    with mp.workdps(dps):
+        return _Z_riemann_siegel_mp(t, n_terms)
+
+
+def _Z_riemann_siegel_mp(t: float, n_terms: Optional[int]) -> mp.mpf:
     t = mp.mpf(t)
     th = theta(t)
     if n_terms is None:
@@ -59,12 +342,59 @@ def Z_riemann_siegel(t: float, n_terms: Optional[int] = None) -> mp.mpf:
     return 2 * s
 
 
+@dataclass
+class PrimeTable:
+    '''
+    Structure-of-arrays view of a prime (or pseudo-prime) list: contiguous
+    float64 arrays that every Z_euler_* variant shares by reference, built
+    once per run instead of per call.
+
+    pow_neg_half_k[k-1] holds p**(-k/2) for k = 1..k_max.
+    '''
+    p: np.ndarray
+    log_p: np.ndarray
+    inv_sqrt_p: np.ndarray
+    pow_neg_half_k: List[np.ndarray] = field(default_factory=list)
+
+    @classmethod
+    def build(cls, primes: Sequence[float], k_max: int = 1) -> "PrimeTable":
+        p = np.asarray(primes, dtype=np.float64)
+        inv_sqrt_p = p ** -0.5
+        tab = cls(p=p, log_p=np.log(p), inv_sqrt_p=inv_sqrt_p)
+        tab.ensure_k(k_max)
+        return tab
+
+    def ensure_k(self, k_max: int) -> None:
+        for k in range(len(self.pow_neg_half_k) + 1, k_max + 1):
+            self.pow_neg_half_k.append(self.p ** (-k / 2.0))
+
+
+PrimesLike = Union[PrimeTable, Sequence[float]]
+
+# Tables built from bare sequences are cached by list identity (the prime
+# list is built once per run, so id() is a safe key).
+_prime_table_cache: Dict[int, PrimeTable] = {}
+
+
+def _prime_table(primes: PrimesLike, k_max: int) -> PrimeTable:
+    if isinstance(primes, PrimeTable):
+        primes.ensure_k(k_max)
+        return primes
+    tab = _prime_table_cache.get(id(primes))
+    if tab is None:
+        tab = PrimeTable.build(primes, k_max)
+        _prime_table_cache[id(primes)] = tab
+    else:
+        tab.ensure_k(k_max)
+    return tab
+
+
 def Z_euler_partial(
     t: float,
-    primes: Sequence[int],
+    primes: PrimesLike,
     k_max: int = 1,
     use_log: bool = True,
-) -> mp.mpf:
+) -> float:
     '''
     Baseline "independent primes" model from a partial Euler product on the critical line.
 
@@ -77,21 +407,50 @@ def Z_euler_partial(
 
     WARNING: this model does NOT encode the functional equation, and typically fails to show
     GUE level repulsion (Poisson is the expected baseline).
+
+    Accepts a PrimeTable (preferred; shared by reference) or a bare sequence,
+    so the per-t work is one vectorized cos/sum per k. Returns a Python float.
     '''
-    t = mp.mpf(t)
+    t = float(t)
+    tab = _prime_table(primes, k_max)
 
     if use_log:
-        re_log = mp.mpf("0.0")
-        for p in primes:
-            lp = mp.log(p)
-            for k in range(1, k_max + 1):
-                re_log += (mp.cos(k * t * lp) / k) * (mp.power(p, -mp.mpf(k) / 2))
-        return mp.e ** re_log
+        re_log = 0.0
+        for k in range(1, k_max + 1):
+            re_log += _euler_kernel(k * t, tab.log_p, tab.pow_neg_half_k[k - 1]) / k
+        return math.exp(re_log)
 
-    prod = 1
-    for p in primes:
-        prod *= 1 / (1 - mp.power(p, -mp.mpf("0.5") - 1j * t))
-    return mp.re(prod)
+    # Accumulate the product in log space: with many primes a direct np.prod
+    # can drift through very large/small magnitudes before cancelling.
+    terms = 1.0 / (1.0 - tab.inv_sqrt_p * np.exp(-1j * t * tab.log_p))
+    return float(np.exp(np.sum(np.log(terms))).real)
+
+
+def Z_euler_partial_vec(
+    ts: np.ndarray,
+    primes: PrimesLike,
+    k_max: int = 1,
+    use_log: bool = True,
+    chunk: int = 256,
+) -> np.ndarray:
+    '''
+    Batch Z_euler_partial over a t-grid. Works in chunks so the
+    (t x primes) intermediate stays cache-sized.
+    '''
+    ts = np.asarray(ts, dtype=np.float64)
+    tab = _prime_table(primes, k_max)
+    out = np.empty_like(ts)
+    for lo in range(0, ts.size, chunk):
+        tc = ts[lo : lo + chunk]
+        if use_log:
+            re_log = np.zeros_like(tc)
+            for k in range(1, k_max + 1):
+                re_log += (np.cos(np.outer(k * tc, tab.log_p)) @ tab.pow_neg_half_k[k - 1]) / k
+            out[lo : lo + chunk] = np.exp(re_log)
+        else:
+            terms = 1.0 / (1.0 - tab.inv_sqrt_p * np.exp(-1j * np.outer(tc, tab.log_p)))
+            out[lo : lo + chunk] = np.exp(np.sum(np.log(terms), axis=1)).real
+    return out
 
 
 def jitter_primes(primes: Sequence[int], width: float = 0.5, seed: int = 0) -> List[float]:
@@ -105,46 +464,64 @@ def jitter_primes(primes: Sequence[int], width: float = 0.5, seed: int = 0) -> L
 
 def Z_euler_partial_float_primes(
     t: float,
-    primes_like: Sequence[float],
+    primes_like: PrimesLike,
     k_max: int = 1,
-) -> mp.mpf:
+) -> float:
     '''
     Log Euler product amplitude using non-integer 'primes' for negative controls.
+    Shares the PrimeTable machinery with Z_euler_partial.
     '''
-    t = mp.mpf(t)
-    re_log = mp.mpf("0.0")
-    for p in primes_like:
-        lp = mp.log(p)
-        for k in range(1, k_max + 1):
-            re_log += (mp.cos(k * t * lp) / k) * (mp.power(p, -mp.mpf(k) / 2))
-    return mp.e ** re_log
+    return Z_euler_partial(t, primes_like, k_max=k_max, use_log=True)
+
+
+# Fixed phase draws per seed: the phases define the model, so they are drawn
+# once and reused across every call instead of re-seeding an RNG per t.
+_phase_cache: Dict[int, np.ndarray] = {}
+
+
+def _phases(seed: int, n_terms: int) -> np.ndarray:
+    phi = _phase_cache.get(seed)
+    if phi is None or phi.size < n_terms:
+        # Redrawing a longer block from the same seed keeps the prefix
+        # identical, so earlier calls stay consistent.
+        size = max(n_terms, 64 if phi is None else 2 * phi.size)
+        rng = np.random.default_rng(seed)
+        phi = rng.uniform(0.0, 2 * math.pi, size)
+        _phase_cache[seed] = phi
+    return phi[:n_terms]
 
 
-def phase_randomized_rs(t: float, seed: int = 0, n_terms: Optional[int] = None) -> mp.mpf:
+def phase_randomized_rs(t: float, seed: int = 0, n_terms: Optional[int] = None) -> float:
     '''
     Negative control: RS-like sum with randomized phases.
     Preserves amplitude scaling 1/sqrt(n) but destroys coherent structure.
     '''
-    import random
-    rng = random.Random(seed)
-    t = mp.mpf(t)
+    t = float(t)
     if n_terms is None:
-        n_terms = int(mp.floor(mp.sqrt(t / (2 * mp.pi))))
-        n_terms = max(1, n_terms)
+        n_terms = max(1, int(math.sqrt(t / (2 * math.pi))))
 
-    s = mp.mpf("0.0")
-    for n in range(1, n_terms + 1):
-        phi = rng.random() * 2 * math.pi
-        s += mp.cos(t * mp.log(n) + phi) / mp.sqrt(n)
-    return 2 * s
+    log_n, inv_sqrt_n = _rs_table(n_terms)
+    return _rs_sum_phased(t, log_n, inv_sqrt_n, _phases(seed, n_terms))
+
+
+def phase_randomized_rs_vec(ts: np.ndarray, seed: int = 0) -> np.ndarray:
+    '''
+    Batch phase_randomized_rs over a t-grid; shares the per-seed phase
+    table with the scalar path.
+    '''
+    ts = np.asarray(ts, dtype=np.float64)
+    out = np.zeros_like(ts)
+    counts = _rs_term_counts(ts)
+    phi = _phases(seed, int(counts.max()))
+    for n_terms in np.unique(counts):
+        m = counts == n_terms
+        log_n, inv_sqrt_n = _rs_table(int(n_terms))
+        out[m] = 2.0 * (np.cos(np.outer(ts[m], log_n) + phi[:n_terms]) @ inv_sqrt_n)
+    return out
 
-def Z_euler_partial_direct_float_primes(t: float, primes_like: Sequence[float]) -> mp.mpf:
+def Z_euler_partial_direct_float_primes(t: float, primes_like: PrimesLike) -> float:
     '''
     Direct Euler product real part using non-integer 'primes' (negative control).
     Returns Re(prod_{p} (1 - p^{-1/2 - i t})^{-1}).
     '''
-    t = mp.mpf(t)
-    prod = 1
-    for p in primes_like:
-        prod *= 1 / (1 - mp.power(p, -mp.mpf("0.5") - 1j * t))
-    return mp.re(prod)
+    return Z_euler_partial(t, primes_like, use_log=False)
@@ -7,6 +7,12 @@ from dataclasses import dataclass
 from typing import Callable, List, Tuple, Optional
 
 import mpmath as mp
+import numpy as np
+from scipy.optimize import brentq
+
+
+# mpmath working precision during scans; ample for refine_tol=1e-10.
+_SCAN_DPS = 20
 
 
 @dataclass
@@ -17,15 +23,65 @@ class ZeroScanConfig:
     refine_max_iter: int = 80
     refine_tol: float = 1e-10
     max_zeros: Optional[int] = 200
+    # Refine brackets in mpmath instead of float64. The models return Python
+    # floats, so this only pays off when high-precision zeros are wanted.
+    mpmath_refine: bool = False
+
+
+def scan_grid(cfg: ZeroScanConfig) -> np.ndarray:
+    '''
+    The t-grid bracket_zeros walks: t_min, t_min+dt, ..., clamped at t_max.
+    '''
+    ts = np.arange(cfg.t_min, cfg.t_max, cfg.dt)
+    return np.append(ts, cfg.t_max)
+
+
+def _brackets_from_grid(ts: np.ndarray, fs: np.ndarray, cfg: ZeroScanConfig) -> List[Tuple[float, float]]:
+    brackets = [(float(t), float(t)) for t in ts[fs == 0.0]]
+    idx = np.where(fs[:-1] * fs[1:] < 0)[0]
+    brackets += [(float(ts[i]), float(ts[i + 1])) for i in idx]
+    brackets.sort()
+    if cfg.max_zeros is not None:
+        brackets = brackets[: cfg.max_zeros]
+    return brackets
+
+
+def _memoize(f: Callable[[float], float], seed: Optional[dict] = None) -> Callable[[float], float]:
+    '''
+    Cache f on exact float arguments: refinement re-evaluates the bracket
+    endpoints the scan already computed, and the grid points are bit-identical
+    floats, so a plain dict reuses them without perturbing any evaluation.
+    '''
+    cache = dict(seed) if seed else {}
+
+    def g(t: float) -> float:
+        v = cache.get(t)
+        if v is None:
+            v = f(t)
+            cache[t] = v
+        return v
 
+    return g
+
+
+def bracket_zeros(
+    f: Callable[[float], float],
+    cfg: ZeroScanConfig,
+    f_vec: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> List[Tuple[float, float]]:
+    if f_vec is not None:
+        # Batch path: evaluate the whole grid at once and find every sign
+        # change in a single vectorized pass.
+        ts = scan_grid(cfg)
+        fs = np.asarray(f_vec(ts), dtype=float)
+        return _brackets_from_grid(ts, fs, cfg)
 
-def bracket_zeros(f: Callable[[float], float], cfg: ZeroScanConfig) -> List[Tuple[float, float]]:
     t = cfg.t_min
-    fa = mp.mpf(f(t))
+    fa = f(t)
     brackets: List[Tuple[float, float]] = []
     while t < cfg.t_max:
         t2 = min(cfg.t_max, t + cfg.dt)
-        fb = mp.mpf(f(t2))
+        fb = f(t2)
         if fa == 0:
             brackets.append((t, t))
         elif fb == 0:
@@ -38,18 +94,8 @@ def bracket_zeros(f: Callable[[float], float], cfg: ZeroScanConfig) -> List[Tupl
     return brackets
 
 
-def refine_root_bisect(f: Callable[[float], float], a: float, b: float, cfg: ZeroScanConfig) -> float:
-    if a == b:
-        return a
+def _refine_root_bisect_mp(f: Callable[[float], float], a: float, b: float, cfg: ZeroScanConfig) -> float:
     fa = mp.mpf(f(a))
-    fb = mp.mpf(f(b))
-    if fa == 0:
-        return a
-    if fb == 0:
-        return b
-    if fa * fb > 0:
-        raise ValueError("Interval does not bracket a root.")
-
     lo, hi = mp.mpf(a), mp.mpf(b)
     for _ in range(cfg.refine_max_iter):
         mid = (lo + hi) / 2
@@ -57,22 +103,69 @@ def refine_root_bisect(f: Callable[[float], float], a: float, b: float, cfg: Zer
         if abs(fm) < cfg.refine_tol or abs(hi - lo) < cfg.refine_tol:
             return float(mid)
         if fa * fm < 0:
-            hi, fb = mid, fm
+            hi = mid
         else:
             lo, fa = mid, fm
     return float((lo + hi) / 2)
 
 
-def find_zeros(f: Callable[[float], float], cfg: ZeroScanConfig) -> List[float]:
-    brackets = bracket_zeros(f, cfg)
-    zeros: List[float] = []
-    for a, b in brackets:
-        try:
-            z = refine_root_bisect(f, a, b, cfg)
-            if not zeros or abs(z - zeros[-1]) > max(cfg.dt, 1e-6):
-                zeros.append(z)
-        except Exception:
-            continue
-        if cfg.max_zeros is not None and len(zeros) >= cfg.max_zeros:
-            break
-    return zeros
+def refine_root_bisect(f: Callable[[float], float], a: float, b: float, cfg: ZeroScanConfig) -> float:
+    if a == b:
+        return a
+    fa = f(a)
+    fb = f(b)
+    if fa == 0:
+        return a
+    if fb == 0:
+        return b
+    if fa * fb > 0:
+        raise ValueError("Interval does not bracket a root.")
+
+    if cfg.mpmath_refine:
+        return _refine_root_bisect_mp(f, a, b, cfg)
+
+    # Brent's method (inverse quadratic interpolation with bisection fallback)
+    # converges superlinearly, so it needs far fewer f(t) evaluations than
+    # plain bisection on the dt-wide brackets from the scan.
+    return float(brentq(f, a, b, xtol=cfg.refine_tol, maxiter=cfg.refine_max_iter))
+
+
+def find_zeros(
+    f: Callable[[float], float],
+    cfg: ZeroScanConfig,
+    f_vec: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> np.ndarray:
+    # Scanning only needs ~1e-10, so cap mpmath working precision for any
+    # mpmath-backed f; verify_zeros re-checks at high precision if wanted.
+    with mp.workdps(_SCAN_DPS):
+        if f_vec is not None:
+            ts = scan_grid(cfg)
+            fs = np.asarray(f_vec(ts), dtype=float)
+            brackets = _brackets_from_grid(ts, fs, cfg)
+            # Seed the memo with the grid values so refinement never repeats
+            # an endpoint evaluation the scan already paid for.
+            f = _memoize(f, seed=dict(zip(ts.tolist(), fs.tolist())))
+        else:
+            f = _memoize(f)
+            brackets = bracket_zeros(f, cfg)
+        zeros: List[float] = []
+        for a, b in brackets:
+            try:
+                z = refine_root_bisect(f, a, b, cfg)
+                if not zeros or abs(z - zeros[-1]) > max(cfg.dt, 1e-6):
+                    zeros.append(z)
+            except Exception:
+                continue
+            if cfg.max_zeros is not None and len(zeros) >= cfg.max_zeros:
+                break
+    return np.asarray(zeros, dtype=float)
+
+
+def verify_zeros(zeros: np.ndarray, f: Callable[[float], float], dps: int = 50) -> np.ndarray:
+    '''
+    Re-evaluate f at each found zero at high precision and return the
+    residuals |f(z)| — the separate certification step that justifies
+    keeping the scan itself at low dps.
+    '''
+    with mp.workdps(dps):
+        return np.array([abs(float(f(z))) for z in zeros], dtype=float)
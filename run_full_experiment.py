@@ -14,28 +14,79 @@ from __future__ import annotations
 
 import argparse
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
+import numpy as np
+
 from guesuite.models import (
-    Z_full, Z_riemann_siegel, Z_euler_partial,
-    jitter_primes, Z_euler_partial_direct_float_primes, phase_randomized_rs
+    PrimeTable, Z_rs_full, Z_riemann_siegel, Z_riemann_siegel_vec,
+    Z_euler_partial, Z_euler_partial_vec, jitter_primes,
+    Z_euler_partial_direct_float_primes, phase_randomized_rs,
+    phase_randomized_rs_vec,
 )
 from guesuite.zeros import ZeroScanConfig, find_zeros
 from guesuite.stats import unfold_spacings, summarize_spacings
 
 
-def primes_up_to(n: int) -> list[int]:
-    sieve = [True] * (n + 1)
-    if n >= 0:
-        sieve[0] = False
-    if n >= 1:
-        sieve[1] = False
-    r = int(n ** 0.5)
-    for p in range(2, r + 1):
+def primes_up_to(n: int) -> np.ndarray:
+    sieve = np.ones(n + 1, dtype=bool)
+    sieve[: min(2, n + 1)] = False
+    for p in range(2, int(n ** 0.5) + 1):
         if sieve[p]:
-            for q in range(p * p, n + 1, p):
-                sieve[q] = False
-    return [i for i in range(2, n + 1) if sieve[i]]
+            sieve[p * p :: p] = False
+    return np.flatnonzero(sieve)
+
+
+MODEL_NAMES = [
+    "independent_primes",
+    "riemann_siegel",
+    "full_zeta",
+    "fake_primes_jitter",
+    "rs_phase_randomized",
+]
+
+
+def _build_model(name: str, p_max: int, k_max: int, seed: int):
+    '''
+    Return (scalar f for refinement, batch f_vec for the shared-grid
+    bracket scan) for one model channel. Built per process so everything
+    that reaches the worker is picklable.
+    '''
+    primes = primes_up_to(p_max)
+    if name == "independent_primes":
+        prime_table = PrimeTable.build(primes, k_max=k_max)
+        return (
+            lambda t: float(Z_euler_partial(t, primes=prime_table, k_max=k_max, use_log=False)),
+            lambda ts: Z_euler_partial_vec(ts, primes=prime_table, k_max=k_max, use_log=False),
+        )
+    if name == "riemann_siegel":
+        return (lambda t: float(Z_riemann_siegel(t)), Z_riemann_siegel_vec)
+    if name == "full_zeta":
+        return (
+            lambda t: float(Z_rs_full(t)),
+            lambda ts: np.array([Z_rs_full(t) for t in ts]),
+        )
+    if name == "fake_primes_jitter":
+        fake_table = PrimeTable.build(jitter_primes(primes, width=0.5, seed=seed))
+        return (
+            lambda t: float(Z_euler_partial_direct_float_primes(t, primes_like=fake_table)),
+            lambda ts: Z_euler_partial_vec(ts, primes=fake_table, use_log=False),
+        )
+    if name == "rs_phase_randomized":
+        return (
+            lambda t: float(phase_randomized_rs(t, seed=seed)),
+            lambda ts: phase_randomized_rs_vec(ts, seed=seed),
+        )
+    raise ValueError(f"Unknown model: {name}")
+
+
+def _scan_one(name: str, cfg: ZeroScanConfig, p_max: int, k_max: int, seed: int):
+    f, f_vec = _build_model(name, p_max, k_max, seed)
+    zeros = find_zeros(f, cfg, f_vec=f_vec)
+    spacings = unfold_spacings(zeros)
+    return name, zeros, summarize_spacings(spacings)
 
 
 def main():
@@ -50,36 +101,27 @@ def main():
     ap.add_argument("--seed", type=int, default=0)
 
     ap.add_argument("--outdir", type=str, default="out_gue")
+    ap.add_argument("--jobs", type=int, default=None,
+                    help="worker processes for the model scans (default: one per model; 1 = serial)")
     args = ap.parse_args()
 
     outdir = Path(args.outdir)
     outdir.mkdir(parents=True, exist_ok=True)
 
-    primes = primes_up_to(args.p_max)
-
     cfg = ZeroScanConfig(t_min=args.t_min, t_max=args.t_max, dt=args.dt, max_zeros=args.max_zeros)
 
-    fake_primes = jitter_primes(primes, width=0.5, seed=args.seed)
-
-    models = {
-        "independent_primes": lambda t: float(Z_euler_partial(t, primes=primes, k_max=args.k_max, use_log=False)),
-        "riemann_siegel": lambda t: float(Z_riemann_siegel(t)),
-        "full_zeta": lambda t: float(Z_full(t)),
-        "fake_primes_jitter": lambda t: float(Z_euler_partial_direct_float_primes(t, primes_like=fake_primes)),
-        "rs_phase_randomized": lambda t: float(phase_randomized_rs(t, seed=args.seed)),
-    }
+    scan = partial(_scan_one, cfg=cfg, p_max=args.p_max, k_max=args.k_max, seed=args.seed)
+    if args.jobs == 1:
+        results = [scan(name) for name in MODEL_NAMES]
+    else:
+        # The five model scans are independent and CPU-bound.
+        with ProcessPoolExecutor(max_workers=args.jobs or len(MODEL_NAMES)) as ex:
+            results = list(ex.map(scan, MODEL_NAMES))
 
     report = {}
 
-    for name, f in models.items():
-        zeros = find_zeros(f, cfg)
-        spacings = unfold_spacings(zeros)
-        summary = summarize_spacings(spacings)
-
-        (outdir / f"zeros_{name}.csv").write_text(
-            "t\\n" + "\\n".join(f"{z:.12f}" for z in zeros) + "\\n",
-            encoding="utf-8"
-        )
+    for name, zeros, summary in results:
+        np.savetxt(outdir / f"zeros_{name}.csv", zeros, fmt="%.12f", header="t", comments="")
 
         report[name] = {
             "scan": {"t_min": args.t_min, "t_max": args.t_max, "dt": args.dt, "max_zeros": args.max_zeros},